@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
 
-from .const import DOMAIN
+from .const import DATA_TICK_UNSUB, DOMAIN, SIGNAL_TICK
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +23,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = entry.data
 
+    # One hourly tick serves every scheduler entity
+    if DATA_TICK_UNSUB not in hass.data[DOMAIN]:
+
+        @callback
+        def _async_tick(now: datetime) -> None:
+            async_dispatcher_send(hass, SIGNAL_TICK, now)
+
+        hass.data[DOMAIN][DATA_TICK_UNSUB] = async_track_time_change(
+            hass, _async_tick, minute=0, second=0
+        )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -32,6 +46,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        if hass.data[DOMAIN].keys() == {DATA_TICK_UNSUB}:
+            hass.data[DOMAIN].pop(DATA_TICK_UNSUB)()
 
     return unload_ok
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import logging
+import time as _time
+from dataclasses import dataclass
 from datetime import datetime, time
-from typing import Any
-
-import voluptuous as vol
+from typing import Any, Final
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -24,9 +26,10 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_CLIMATE_ENTITY,
@@ -40,10 +43,24 @@ from .const import (
     PRESET_AWAY,
     PRESET_SLEEP,
     PRESET_VACATION,
+    SIGNAL_TICK,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+MINUTES_PER_DAY: Final = 1440
+MANUAL_OVERRIDE_DURATION: Final = 1800  # Respect manual changes for 30 minutes
+APPLY_DEBOUNCE_DELAY: Final = 0.1  # Coalesce rapid changes before applying
+UNAVAILABLE_LOG_INTERVAL: Final = 900  # Warn about an unavailable target every 15 minutes
+
+
+@dataclass(slots=True, frozen=True)
+class Slot:
+    """A parsed schedule slot."""
+
+    time: time
+    preset: str
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -58,6 +75,7 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
     """Representation of a Climate Scheduler."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
     _attr_hvac_modes = [HVACMode.HEAT, HVACMode.COOL, HVACMode.HEAT_COOL, HVACMode.OFF]
     _attr_preset_modes = [PRESET_HOME, PRESET_AWAY, PRESET_SLEEP, PRESET_VACATION]
     _attr_supported_features = (
@@ -77,6 +95,16 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
         self._climate_entity = entry.data.get(CONF_CLIMATE_ENTITY)
         self._schedules = entry.options.get(CONF_SCHEDULES, entry.data.get(CONF_SCHEDULES, {}))
         self._presets = entry.options.get(CONF_PRESETS, entry.data.get(CONF_PRESETS, {}))
+        self._slot_times: dict[str, list[time]] = {}
+        self._slot_labels: dict[str, list[str]] = {}
+        self._slot_presets: dict[str, list[str]] = {}
+        self._preset_temp: dict[str, float] = {}
+        self._presets_by_idx: list[str | None] = []
+        self._bucket_table: dict[str, bytes] = {}
+        self._next_cache: (
+            tuple[tuple[str, int], tuple[str | None, float | None]] | None
+        ) = None
+        self._compile_schedules()
         
         # State
         self._attr_current_temperature: float | None = None
@@ -86,8 +114,69 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
         self._attr_hvac_action = HVACAction.IDLE
         
         # Schedule tracking
-        self._unsubscribe_time_listener = None
-        self._last_preset_change: datetime | None = None
+        self._unsubscribe_time_listener: asyncio.TimerHandle | None = None
+        self._unsubscribe_tick = None
+        self._last_preset_change: float | None = None
+        self._prev_applied_temp: float | None = None
+        self._prev_applied_mode: HVACMode | None = None
+        self._last_unavail_log: float | None = None
+        self._apply_debounce_handle: asyncio.TimerHandle | None = None
+        self._pending_changes: set[str] | None = set()
+
+    def _compile_schedules(self) -> None:
+        """Parse and sort the configured schedule slots and presets once."""
+        self._slot_times = {}
+        self._slot_labels = {}
+        self._slot_presets = {}
+        self._preset_temp = {}
+        self._presets_by_idx = []
+        self._bucket_table = {}
+        self._next_cache = None
+
+        for preset, preset_config in self._presets.items():
+            try:
+                self._preset_temp[preset] = float(preset_config["temperature"])
+            except (KeyError, ValueError, TypeError):
+                _LOGGER.warning("Ignoring invalid preset %s: %s", preset, preset_config)
+
+        for schedule_type, day_schedule in self._schedules.items():
+            slots: list[Slot] = []
+            for slot in day_schedule:
+                try:
+                    slot_time = time.fromisoformat(slot.get("time", "00:00"))
+                    if slot_time.tzinfo is not None:
+                        # Offsets would make the slots incomparable
+                        raise ValueError("UTC offsets are not supported")
+                except (ValueError, TypeError):
+                    _LOGGER.warning(
+                        "Ignoring invalid %s schedule slot: %s", schedule_type, slot
+                    )
+                    continue
+                slots.append(Slot(slot_time, slot.get("preset")))
+            slots.sort(key=lambda x: x.time)
+            self._slot_times[schedule_type] = [slot.time for slot in slots]
+            self._slot_labels[schedule_type] = [
+                slot.time.strftime("%H:%M") for slot in slots
+            ]
+            self._slot_presets[schedule_type] = [slot.preset for slot in slots]
+            if slots:
+                self._bucket_table[schedule_type] = self._build_bucket_table(slots)
+
+    def _build_bucket_table(self, slots: list[Slot]) -> bytes:
+        """Map every minute of the day to the index of its active preset."""
+        indexes = []
+        for slot in slots:
+            if slot.preset not in self._presets_by_idx:
+                self._presets_by_idx.append(slot.preset)
+            indexes.append(self._presets_by_idx.index(slot.preset))
+
+        starts = [slot.time.hour * 60 + slot.time.minute for slot in slots]
+        # The last slot of the day stays active until the first one
+        table = bytearray([indexes[-1]]) * MINUTES_PER_DAY
+        for i, start in enumerate(starts):
+            end = starts[i + 1] if i + 1 < len(starts) else MINUTES_PER_DAY
+            table[start:end] = bytes([indexes[i]]) * (end - start)
+        return bytes(table)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -103,11 +192,12 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        next_schedule, next_temperature = self._compute_next()
         return {
             "scheduled_entity": self._climate_entity,
             "active_preset": self._attr_preset_mode,
-            "next_schedule": self._get_next_schedule(),
-            "next_temperature": self._get_next_temperature(),
+            "next_schedule": next_schedule,
+            "next_temperature": next_temperature,
         }
 
     async def async_added_to_hass(self) -> None:
@@ -124,32 +214,90 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
                     pass
 
         # Set up schedule checker
-        self._unsubscribe_time_listener = async_track_time_change(
-            self.hass,
-            self._async_check_schedule,
-            minute=range(0, 60, 5),  # Check every 5 minutes
-            second=0,
+        self._unsubscribe_tick = async_dispatcher_connect(
+            self.hass, SIGNAL_TICK, self._on_boundary
         )
+        self._arm_boundary_timer(dt_util.now())
         
         # Initial schedule check
         await self._async_check_schedule(None)
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity is removed from hass."""
+        if self._unsubscribe_tick:
+            self._unsubscribe_tick()
+            self._unsubscribe_tick = None
+        if self._unsubscribe_time_listener:
+            self._unsubscribe_time_listener.cancel()
+            self._unsubscribe_time_listener = None
+        if self._apply_debounce_handle:
+            self._apply_debounce_handle.cancel()
+            self._apply_debounce_handle = None
+
+    def _next_transition_seconds(self, now_dt: datetime) -> float | None:
+        """Return the seconds until the next slot boundary today, if any."""
+        schedule_type = SCHEDULE_WEEKDAY if now_dt.weekday() < 5 else SCHEDULE_WEEKEND
+        slot_times = self._slot_times.get(schedule_type, [])
+
+        idx = bisect.bisect_right(slot_times, now_dt.time())
+        if idx == len(slot_times):
+            return None
+        next_dt = datetime.combine(now_dt.date(), slot_times[idx], now_dt.tzinfo)
+        return (next_dt - now_dt).total_seconds()
+
+    @callback
+    def _arm_boundary_timer(self, now_dt: datetime) -> None:
+        """Schedule the next check for the next schedule transition."""
         if self._unsubscribe_time_listener:
-            self._unsubscribe_time_listener()
+            self._unsubscribe_time_listener.cancel()
+            self._unsubscribe_time_listener = None
+
+        delay = self._next_transition_seconds(now_dt)
+
+        # Wake up when a manual override expires if the schedule disagrees
+        if self._last_preset_change is not None and self._active_preset_for(
+            now_dt
+        ) not in (None, self._attr_preset_mode):
+            remaining = MANUAL_OVERRIDE_DURATION - (
+                _time.monotonic() - self._last_preset_change
+            )
+            if remaining > 0:
+                delay = remaining if delay is None else min(delay, remaining)
+
+        # The shared hourly tick covers midnight and wall-clock drift
+        if delay is not None:
+            self._unsubscribe_time_listener = self.hass.loop.call_later(
+                delay, self._on_boundary
+            )
+
+    @callback
+    def _on_boundary(self, now: datetime | None = None) -> None:
+        """Run the schedule check and re-arm the timer."""
+        now_dt = now or dt_util.now()
+        self.hass.async_create_task(self._async_check_schedule(now_dt))
+        self._arm_boundary_timer(now_dt)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if temperature := kwargs.get(ATTR_TEMPERATURE):
+            if (
+                temperature == self._attr_target_temperature
+                and temperature == self._prev_applied_temp
+            ):
+                return
             self._attr_target_temperature = temperature
-            await self._async_apply_to_climate_entity()
+            self._async_schedule_apply({"temperature"})
             self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target HVAC mode."""
+        if (
+            hvac_mode == self._attr_hvac_mode
+            and hvac_mode == self._prev_applied_mode
+        ):
+            return
         self._attr_hvac_mode = hvac_mode
-        await self._async_apply_to_climate_entity()
+        self._async_schedule_apply({"hvac_mode"})
         self.async_write_ha_state()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
@@ -158,14 +306,25 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
             _LOGGER.warning("Invalid preset mode: %s", preset_mode)
             return
             
+        self._last_preset_change = _time.monotonic()
+        preset_temp = self._preset_temp.get(preset_mode, 21)
+        if (
+            preset_mode == self._attr_preset_mode
+            and preset_temp == self._attr_target_temperature
+            and preset_temp == self._prev_applied_temp
+        ):
+            return
+
         self._attr_preset_mode = preset_mode
-        self._last_preset_change = datetime.now()
+        self._next_cache = None
+        if self._unsubscribe_tick:
+            # Re-arm so the schedule resumes once the override expires
+            self._arm_boundary_timer(dt_util.now())
         
         # Apply preset temperature immediately
-        preset_temp = self._presets.get(preset_mode, {}).get("temperature", 21)
         self._attr_target_temperature = preset_temp
         
-        await self._async_apply_to_climate_entity()
+        self._async_schedule_apply()
         self.async_write_ha_state()
 
     @callback
@@ -174,32 +333,17 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
         if not self._schedules:
             return
 
-        current_time = datetime.now().time()
-        current_day = datetime.now().weekday()
-        
-        # Determine if weekday or weekend
-        schedule_type = SCHEDULE_WEEKDAY if current_day < 5 else SCHEDULE_WEEKEND
-        day_schedule = self._schedules.get(schedule_type, [])
-        
-        if not day_schedule:
-            return
-
-        # Find current time slot
-        active_preset = None
-        for slot in sorted(day_schedule, key=lambda x: x.get("time", "00:00")):
-            slot_time = datetime.strptime(slot.get("time", "00:00"), "%H:%M").time()
-            if current_time >= slot_time:
-                active_preset = slot.get("preset")
-            else:
-                break
+        now_dt = now or dt_util.now()
+        active_preset = self._active_preset_for(now_dt)
 
         if active_preset and active_preset != self._attr_preset_mode:
             # Check for manual override (don't change if user manually set in last 30 min)
-            if self._last_preset_change:
-                minutes_since_manual = (datetime.now() - self._last_preset_change).total_seconds() / 60
-                if minutes_since_manual < 30:
-                    _LOGGER.debug("Manual override active, skipping schedule change")
-                    return
+            if (
+                self._last_preset_change is not None
+                and _time.monotonic() - self._last_preset_change < MANUAL_OVERRIDE_DURATION
+            ):
+                _LOGGER.debug("Manual override active, skipping schedule change")
+                return
             
             _LOGGER.info(
                 "Schedule changing preset from %s to %s",
@@ -208,14 +352,77 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
             )
             await self.async_set_preset_mode(active_preset)
 
-    async def _async_apply_to_climate_entity(self) -> None:
-        """Apply current settings to the underlying climate entity."""
+    def _active_preset_for(self, now_dt: datetime) -> str | None:
+        """Return the preset scheduled for the given moment."""
+        # Determine if weekday or weekend
+        schedule_type = SCHEDULE_WEEKDAY if now_dt.weekday() < 5 else SCHEDULE_WEEKEND
+        table = self._bucket_table.get(schedule_type)
+
+        if table is None:
+            return None
+
+        return self._presets_by_idx[table[now_dt.hour * 60 + now_dt.minute]]
+
+    @callback
+    def _async_schedule_apply(self, changed: set[str] | None = None) -> None:
+        """Apply settings after a short delay so rapid changes coalesce.
+
+        ``changed`` follows _async_apply_to_climate_entity; ``None`` means
+        compare every field and wins over explicit sets.
+        """
+        if changed is None or self._pending_changes is None:
+            self._pending_changes = None
+        else:
+            self._pending_changes |= changed
+
+        if self._apply_debounce_handle:
+            self._apply_debounce_handle.cancel()
+        self._apply_debounce_handle = self.hass.loop.call_later(
+            APPLY_DEBOUNCE_DELAY, self._async_flush_apply
+        )
+
+    @callback
+    def _async_flush_apply(self) -> None:
+        """Apply the settings collected since the last flush."""
+        self._apply_debounce_handle = None
+        changed, self._pending_changes = self._pending_changes, set()
+        self.hass.async_create_task(self._async_apply_to_climate_entity(changed))
+
+    async def _async_apply_to_climate_entity(
+        self, changed: set[str] | None = None
+    ) -> None:
+        """Apply current settings to the underlying climate entity.
+
+        Only the fields in ``changed`` are sent; when omitted, fields that
+        differ from what was last applied are sent.
+        """
         if not self._climate_entity:
             return
 
-        try:
-            if self._attr_target_temperature is not None:
-                await self.hass.services.async_call(
+        state = self.hass.states.get(self._climate_entity)
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            now = _time.monotonic()
+            if (
+                self._last_unavail_log is None
+                or now - self._last_unavail_log >= UNAVAILABLE_LOG_INTERVAL
+            ):
+                self._last_unavail_log = now
+                _LOGGER.warning(
+                    "%s is unavailable, not applying settings", self._climate_entity
+                )
+            return
+
+        if changed is None:
+            changed = set()
+            if self._attr_target_temperature != self._prev_applied_temp:
+                changed.add("temperature")
+            if self._attr_hvac_mode != self._prev_applied_mode:
+                changed.add("hvac_mode")
+
+        calls = []
+        if "temperature" in changed and self._attr_target_temperature is not None:
+            calls.append(
+                self.hass.services.async_call(
                     "climate",
                     "set_temperature",
                     {
@@ -224,9 +431,11 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
                     },
                     blocking=False,
                 )
-            
-            if self._attr_hvac_mode is not None:
-                await self.hass.services.async_call(
+            )
+
+        if "hvac_mode" in changed and self._attr_hvac_mode is not None:
+            calls.append(
+                self.hass.services.async_call(
                     "climate",
                     "set_hvac_mode",
                     {
@@ -235,32 +444,43 @@ class ClimateSchedulerEntity(ClimateEntity, RestoreEntity):
                     },
                     blocking=False,
                 )
+            )
+
+        if not calls:
+            return
+
+        try:
+            await asyncio.gather(*calls)
         except Exception as err:
             _LOGGER.error("Failed to apply settings to %s: %s", self._climate_entity, err)
+            return
 
-    def _get_next_schedule(self) -> str | None:
-        """Get the next scheduled change time."""
-        current_time = datetime.now().time()
-        current_day = datetime.now().weekday()
-        schedule_type = SCHEDULE_WEEKDAY if current_day < 5 else SCHEDULE_WEEKEND
-        day_schedule = self._schedules.get(schedule_type, [])
-        
-        for slot in sorted(day_schedule, key=lambda x: x.get("time", "00:00")):
-            slot_time = datetime.strptime(slot.get("time", "00:00"), "%H:%M").time()
-            if current_time < slot_time:
-                return slot.get("time")
-        return None
-
-    def _get_next_temperature(self) -> float | None:
-        """Get the temperature for the next schedule."""
-        current_time = datetime.now().time()
-        current_day = datetime.now().weekday()
-        schedule_type = SCHEDULE_WEEKDAY if current_day < 5 else SCHEDULE_WEEKEND
-        day_schedule = self._schedules.get(schedule_type, [])
-        
-        for slot in sorted(day_schedule, key=lambda x: x.get("time", "00:00")):
-            slot_time = datetime.strptime(slot.get("time", "00:00"), "%H:%M").time()
-            if current_time < slot_time:
-                preset = slot.get("preset")
-                return self._presets.get(preset, {}).get("temperature")
-        return None
+        if "temperature" in changed:
+            self._prev_applied_temp = self._attr_target_temperature
+        if "hvac_mode" in changed:
+            self._prev_applied_mode = self._attr_hvac_mode
+
+    def _compute_next(
+        self, now: datetime | None = None
+    ) -> tuple[str | None, float | None]:
+        """Get the next scheduled change time and its temperature."""
+        now_dt = now or dt_util.now()
+        current_time = now_dt.time()
+        schedule_type = SCHEDULE_WEEKDAY if now_dt.weekday() < 5 else SCHEDULE_WEEKEND
+        cache_key = (schedule_type, now_dt.hour * 60 + now_dt.minute)
+        if self._next_cache is not None and self._next_cache[0] == cache_key:
+            return self._next_cache[1]
+
+        slot_times = self._slot_times.get(schedule_type, [])
+        result: tuple[str | None, float | None] = (None, None)
+
+        idx = bisect.bisect_right(slot_times, current_time)
+        if idx < len(slot_times):
+            preset = self._slot_presets[schedule_type][idx]
+            result = (
+                self._slot_labels[schedule_type][idx],
+                self._preset_temp.get(preset),
+            )
+
+        self._next_cache = (cache_key, result)
+        return result
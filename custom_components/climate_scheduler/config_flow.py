@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
 
 import voluptuous as vol
 
@@ -28,25 +30,34 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-DEFAULT_SCHEDULES = {
-    "weekday": [
-        {"time": "06:00", "preset": PRESET_HOME},
-        {"time": "08:00", "preset": PRESET_AWAY},
-        {"time": "17:00", "preset": PRESET_HOME},
-        {"time": "22:00", "preset": PRESET_SLEEP},
-    ],
-    "weekend": [
-        {"time": "08:00", "preset": PRESET_HOME},
-        {"time": "23:00", "preset": PRESET_SLEEP},
-    ],
-}
-
-DEFAULT_PRESETS = {
-    PRESET_HOME: {"temperature": 21},
-    PRESET_AWAY: {"temperature": 18},
-    PRESET_SLEEP: {"temperature": 19},
-    PRESET_VACATION: {"temperature": 16},
-}
+DEFAULT_SCHEDULES: Final = MappingProxyType({
+    "weekday": (
+        MappingProxyType({"time": "06:00", "preset": PRESET_HOME}),
+        MappingProxyType({"time": "08:00", "preset": PRESET_AWAY}),
+        MappingProxyType({"time": "17:00", "preset": PRESET_HOME}),
+        MappingProxyType({"time": "22:00", "preset": PRESET_SLEEP}),
+    ),
+    "weekend": (
+        MappingProxyType({"time": "08:00", "preset": PRESET_HOME}),
+        MappingProxyType({"time": "23:00", "preset": PRESET_SLEEP}),
+    ),
+})
+
+DEFAULT_PRESETS: Final = MappingProxyType({
+    PRESET_HOME: MappingProxyType({"temperature": 21}),
+    PRESET_AWAY: MappingProxyType({"temperature": 18}),
+    PRESET_SLEEP: MappingProxyType({"temperature": 19}),
+    PRESET_VACATION: MappingProxyType({"temperature": 16}),
+})
+
+
+def _copy_defaults(defaults: Any) -> Any:
+    """Return a mutable, JSON serializable copy of read-only defaults."""
+    if isinstance(defaults, Mapping):
+        return {key: _copy_defaults(value) for key, value in defaults.items()}
+    if isinstance(defaults, tuple):
+        return [_copy_defaults(value) for value in defaults]
+    return defaults
 
 
 class ClimateSchedulerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -68,8 +79,8 @@ class ClimateSchedulerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 title=user_input.get(CONF_NAME, DEFAULT_NAME),
                 data=user_input,
                 options={
-                    CONF_SCHEDULES: DEFAULT_SCHEDULES,
-                    CONF_PRESETS: DEFAULT_PRESETS,
+                    CONF_SCHEDULES: _copy_defaults(DEFAULT_SCHEDULES),
+                    CONF_PRESETS: _copy_defaults(DEFAULT_PRESETS),
                 },
             )
 
@@ -5,6 +5,10 @@ from typing import Final
 DOMAIN: Final = "climate_scheduler"
 DEFAULT_NAME: Final = "Climate Scheduler"
 
+# Shared hourly tick fanned out to all scheduler entities
+DATA_TICK_UNSUB: Final = "tick_unsub"
+SIGNAL_TICK: Final = f"{DOMAIN}_tick"
+
 # Configuration keys
 CONF_CLIMATE_ENTITY: Final = "climate_entity"
 CONF_SCHEDULES: Final = "schedules"
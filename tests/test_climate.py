@@ -0,0 +1,212 @@
+"""Tests for the Climate Scheduler climate platform."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from homeassistant.const import CONF_NAME, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.climate_scheduler.climate import (
+    UNAVAILABLE_LOG_INTERVAL,
+    ClimateSchedulerEntity,
+)
+from custom_components.climate_scheduler.config_flow import (
+    DEFAULT_PRESETS,
+    DEFAULT_SCHEDULES,
+    _copy_defaults,
+)
+from custom_components.climate_scheduler.const import (
+    CONF_CLIMATE_ENTITY,
+    CONF_PRESETS,
+    CONF_SCHEDULES,
+    DOMAIN,
+)
+
+TARGET_ENTITY = "climate.target"
+
+# 2024-01-08 is a Monday, so the weekday schedule applies:
+# 06:00 home, 08:00 away, 17:00 home, 22:00 sleep
+MONDAY = "2024-01-08"
+
+
+async def _async_setup(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    moment: str,
+    schedules: dict[str, Any] | None = None,
+) -> tuple[ClimateSchedulerEntity, str, list[ServiceCall]]:
+    """Set up a scheduler at the given UTC time and flush the initial apply.
+
+    Returns the entity, its entity id and the captured set_temperature calls.
+    """
+    await hass.config.async_update(time_zone="UTC")
+    freezer.move_to(f"{MONDAY} {moment}+00:00")
+    hass.states.async_set(TARGET_ENTITY, "heat")
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_NAME: "Scheduler", CONF_CLIMATE_ENTITY: TARGET_ENTITY},
+        options={
+            CONF_SCHEDULES: schedules or _copy_defaults(DEFAULT_SCHEDULES),
+            CONF_PRESETS: _copy_defaults(DEFAULT_PRESETS),
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = er.async_get(hass).async_get_entity_id("climate", DOMAIN, entry.entry_id)
+    entity = hass.data["climate"].get_entity(entity_id)
+
+    # Climate setup registers the real services, so mock them afterwards
+    temperature_calls = async_mock_service(hass, "climate", "set_temperature")
+    async_mock_service(hass, "climate", "set_hvac_mode")
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    return entity, entity_id, temperature_calls
+
+
+async def test_next_schedule_after_last_slot(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test there is no next schedule or boundary timer after the last slot."""
+    entity, entity_id, _ = await _async_setup(hass, freezer, "23:00:00")
+
+    state = hass.states.get(entity_id)
+    assert state.attributes["preset_mode"] == "sleep"
+    assert state.attributes["next_schedule"] is None
+    assert state.attributes["next_temperature"] is None
+    # Midnight is left to the shared hourly tick
+    assert entity._unsubscribe_time_listener is None
+
+
+async def test_schedule_resumes_when_override_expires(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a manual preset is replaced once the override window ends."""
+    entity, entity_id, _ = await _async_setup(hass, freezer, "17:01:00")
+    assert hass.states.get(entity_id).attributes["preset_mode"] == "home"
+
+    await entity.async_set_preset_mode("away")
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).attributes["preset_mode"] == "away"
+
+    # No slot boundary or hourly tick until 18:00, only the override expiry
+    freezer.tick(timedelta(minutes=29))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).attributes["preset_mode"] == "away"
+
+    freezer.tick(timedelta(minutes=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).attributes["preset_mode"] == "home"
+
+
+async def test_slot_with_utc_offset_is_ignored(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a slot with a UTC offset is skipped instead of failing setup."""
+    schedules = _copy_defaults(DEFAULT_SCHEDULES)
+    schedules["weekday"] = [
+        {"time": "06:00", "preset": "home"},
+        {"time": "08:00+01:00", "preset": "away"},
+    ]
+    _, entity_id, _ = await _async_setup(hass, freezer, "09:00:00", schedules)
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.attributes["preset_mode"] == "home"
+    assert "Ignoring invalid weekday schedule slot" in caplog.text
+
+
+async def test_unavailable_target_is_skipped_and_warned_once(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an unavailable target gets no calls and a rate-limited warning."""
+    entity, _, temperature_calls = await _async_setup(hass, freezer, "09:00:00")
+    hass.states.async_set(TARGET_ENTITY, STATE_UNAVAILABLE)
+    temperature_calls.clear()
+    caplog.clear()
+
+    await entity.async_set_temperature(temperature=22)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert not temperature_calls
+    assert caplog.text.count("is unavailable") == 1
+
+    freezer.tick(timedelta(seconds=UNAVAILABLE_LOG_INTERVAL - 60))
+    await entity.async_set_temperature(temperature=23)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert not temperature_calls
+    assert caplog.text.count("is unavailable") == 1
+
+
+async def test_preset_before_first_slot_wraps_around(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the last slot of the day stays active until the first one."""
+    _, entity_id, _ = await _async_setup(hass, freezer, "03:00:00")
+
+    state = hass.states.get(entity_id)
+    assert state.attributes["preset_mode"] == "sleep"
+    assert state.attributes["next_schedule"] == "06:00"
+    assert state.attributes["next_temperature"] == 21
+
+
+async def test_setter_burst_is_applied_once(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test rapid setter calls coalesce into a single service call."""
+    entity, entity_id, temperature_calls = await _async_setup(hass, freezer, "09:00:00")
+    temperature_calls.clear()
+
+    for temperature in (19, 20, 22):
+        await entity.async_set_temperature(temperature=temperature)
+    assert hass.states.get(entity_id).attributes["temperature"] == 22
+    assert temperature_calls == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert len(temperature_calls) == 1
+    assert temperature_calls[0].data == {
+        "entity_id": TARGET_ENTITY,
+        "temperature": 22,
+    }
+
+
+async def test_skipped_apply_is_retried_with_same_value(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test re-issuing a value that never reached the target applies it."""
+    entity, _, temperature_calls = await _async_setup(hass, freezer, "09:00:00")
+    hass.states.async_set(TARGET_ENTITY, STATE_UNAVAILABLE)
+    temperature_calls.clear()
+
+    await entity.async_set_temperature(temperature=22)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert not temperature_calls
+
+    hass.states.async_set(TARGET_ENTITY, "heat")
+    await entity.async_set_temperature(temperature=22)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert len(temperature_calls) == 1
+    assert temperature_calls[0].data["temperature"] == 22